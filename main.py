@@ -10,11 +10,19 @@ It provides three main functionalities:
 """
 import typer
 import csv
+import os
+import queue
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 from rich.console import Console
 from rich.table import Table
 from rich.progress import Progress
-from transformers import pipeline
+import numpy as np
+import pandas as pd
+import torch
+from transformers import AutoModelForSequenceClassification, AutoTokenizer
 from functools import lru_cache
 from typing import List, Dict, Any
 
@@ -25,6 +33,45 @@ console = Console()
 # --- Shared Constants and Mappings ---
 NONE_TAG = "None of the above"
 
+MODEL_NAME = "facebook/bart-large-mnli"
+
+# Zero-shot classification frames each candidate tag as an NLI hypothesis.
+HYPOTHESIS_TEMPLATE = "This example is {}."
+
+# Index of the "entailment" logit in the MNLI classification head.
+ENTAILMENT_INDEX = 2
+
+# Texts with fewer words than this produce near-uniform scores anyway, so
+# they skip the model entirely and are tagged NONE_TAG at zero confidence.
+MIN_WORDS = 3
+
+# Cap raw text at ~500 tokens worth of characters before tokenization: one
+# pathologically long row would otherwise pad its whole batch to the model
+# maximum, and self-attention cost grows quadratically with length.
+CHAR_CAP = 2000
+
+# Hard token cap per premise/hypothesis pair. BART-MNLI's argmax rarely
+# changes beyond ~200 tokens of premise.
+MAX_TOKENS = 256
+
+# Upper bound on process's cross-chunk duplicate cache (matches the
+# single-text lru_cache bound) so memory stays flat on mostly-distinct files.
+RESULT_CACHE_MAX = 100_000
+
+# Supported inference precisions. Classification only needs the argmax, so
+# reduced precision halves memory traffic with no measurable accuracy change.
+PRECISION_DTYPES = {
+    "fp32": torch.float32,
+    "fp16": torch.float16,
+    "bf16": torch.bfloat16,
+}
+
+# Inference backends. "onnx" requires the optional optimum[onnxruntime] extra.
+BACKENDS = ("torch", "onnx")
+
+# Where the one-time ONNX export is cached between runs.
+ONNX_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "tag-genie" / "bart-large-mnli-onnx"
+
 # MAPPING: Long AI Tags -> Original Short Categories (for comparison in audit/clean)
 TAG_MAP = {
     "Legal Services and Immigration Consultants": "Legal & Immigration",
@@ -43,30 +90,166 @@ SHORT_TAG_MAP = {
     "None of the above": "None"
 }
 
+# MAPPING: Long AI Tags -> (comparison short tag, final DB tag). Folds the two
+# lookups `clean` needs into a single hash probe / map pass per row.
+COMBINED_TAG_MAP = {tag: (TAG_MAP[tag], SHORT_TAG_MAP[tag]) for tag in TAG_MAP}
+
 # ==============================================================================
 # 1. PROCESS COMMAND (Original `process-csv` functionality)
 # ==============================================================================
 
-@lru_cache(maxsize=None)
-def get_classifier():
-    """Loads and caches the zero-shot classification pipeline."""
+def _load_onnx_model(device: str):
+    """Loads BART-MNLI through ONNX Runtime, exporting (once) to a disk cache.
+
+    ORT applies graph optimizations (operator fusion, constant folding) at
+    load time, and optimum's ORTModel binds inputs/outputs via IOBinding on
+    GPU so host<->device copies are avoided.
+    """
+    try:
+        from optimum.onnxruntime import ORTModelForSequenceClassification
+    except ImportError:
+        console.print("[bold red]Error:[/bold red] The onnx backend requires the 'optimum' extra. "
+                      "Install with: pip install 'optimum[onnxruntime]'")
+        raise typer.Exit()
+
+    provider = "CUDAExecutionProvider" if device == "cuda" else "CPUExecutionProvider"
+    if ONNX_CACHE_DIR.is_dir():
+        return ORTModelForSequenceClassification.from_pretrained(ONNX_CACHE_DIR, provider=provider)
+    model = ORTModelForSequenceClassification.from_pretrained(MODEL_NAME, export=True, provider=provider)
+    model.save_pretrained(ONNX_CACHE_DIR)
+    return model
+
+# There is exactly one model per process, so a plain module-level singleton
+# beats lru_cache here: no hash/lock overhead per call, and no surprise
+# second load if a caller passes different arguments mid-run.
+_MODEL = None
+
+def get_model(precision: str = "fp32", int8: bool = False, backend: str = "torch",
+              compile_model: bool = False, device: str = "auto"):
+    """Loads and caches the BART-MNLI tokenizer, model and device.
+
+    device="auto" picks CUDA whenever it is available; without this, BART-large
+    silently runs on CPU at ~50x the latency. With int8=True the linear layers
+    are dynamically quantized to int8, which gives a 2-3x forward-pass speedup
+    on CPUs with VNNI int8 instructions and cuts model memory to roughly a
+    quarter. With backend="onnx" the model runs under ONNX Runtime instead
+    (precision/int8 do not apply there). With compile_model=True the forward
+    path is compiled via torch.compile and warmed up, trading slower startup
+    for faster steady-state batches. Arguments only take effect on the first
+    call of the process.
+    """
+    global _MODEL
+    if _MODEL is not None:
+        return _MODEL
+    if device == "auto":
+        device = "cuda" if torch.cuda.is_available() else "cpu"
+    if int8 and backend == "torch" and device != "cpu":
+        # Dynamically quantized linear ops only ship CPU kernels; a CUDA
+        # forward would fail on the first batch.
+        console.print("[yellow]Warning:[/yellow] --int8 uses CPU-only quantized kernels; running on cpu.")
+        device = "cpu"
     with console.status("[bold green]Loading classification model (this may take a moment)...", spinner="dots"):
-        return pipeline("zero-shot-classification", model="facebook/bart-large-mnli")
+        tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME)
+        if backend == "onnx":
+            model = _load_onnx_model(device)
+        else:
+            model = AutoModelForSequenceClassification.from_pretrained(
+                MODEL_NAME, torch_dtype=PRECISION_DTYPES[precision])
+            model.eval()
+            model.to(device)
+            if int8:
+                model = torch.quantization.quantize_dynamic(
+                    model, {torch.nn.Linear}, dtype=torch.qint8)
+            if compile_model:
+                if hasattr(torch, "compile"):
+                    model = torch.compile(model, mode="reduce-overhead", fullgraph=False)
+                    # Run one throwaway forward now so graph capture happens
+                    # under the spinner, not on the first real batch.
+                    warmup = tokenizer("warm up", HYPOTHESIS_TEMPLATE.format("warm up"),
+                                       return_tensors="pt").to(device)
+                    with torch.no_grad():
+                        model(**warmup)
+                else:
+                    console.print("[yellow]Warning:[/yellow] --compile requires PyTorch 2.0+; continuing without compilation.")
+        _MODEL = (tokenizer, model, device)
+        return _MODEL
+
+def classify_texts(texts: List[str], candidate_tags: List[str], batch_size: int = 32,
+                   precision: str = "fp32", int8: bool = False, backend: str = "torch"):
+    """Yields a (text, result) pair for each input text.
+
+    Runs the NLI model directly instead of going through the zero-shot
+    pipeline: the hypothesis strings for the (fixed) tag list are built once
+    per call, and each batch is a contiguous text-by-hypothesis cross-product,
+    avoiding the pipeline's per-invocation Python overhead and its redundant
+    re-tokenization of the same hypotheses for every input.
+
+    Texts are dispatched in token-length order ("smart batching") so each
+    batch pads to roughly its own length instead of the longest text in the
+    whole input. Results therefore stream back out of input order, paired
+    with their text.
+    """
+    # Chunks made entirely of cached duplicates or skipped short texts yield
+    # an empty batch, which the fast tokenizer rejects with an IndexError.
+    if not texts:
+        return
+
+    tokenizer, model, device = get_model(precision, int8, backend)
+    hypotheses = [HYPOTHESIS_TEMPLATE.format(tag) for tag in candidate_tags]
+    num_tags = len(candidate_tags)
+
+    lengths = [len(ids) for ids in
+               tokenizer(list(texts), truncation=True, max_length=MAX_TOKENS)["input_ids"]]
+    order = sorted(range(len(texts)), key=lengths.__getitem__)
+    batches = [order[start:start + batch_size] for start in range(0, len(order), batch_size)]
+
+    def encode(indices):
+        chunk = [texts[i] for i in indices]
+        premises = [text for text in chunk for _ in range(num_tags)]
+        return chunk, tokenizer(premises, hypotheses * len(chunk),
+                                padding=True, truncation=True, max_length=MAX_TOKENS,
+                                return_tensors="pt").to(device)
+
+    # Encode the next batch on a worker thread while the model runs the
+    # current one; the fast tokenizer releases the GIL so both proceed.
+    with torch.no_grad(), ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(encode, batches[0]) if batches else None
+        for b in range(len(batches)):
+            chunk, encoded = pending.result()
+            pending = pool.submit(encode, batches[b + 1]) if b + 1 < len(batches) else None
+            logits = model(**encoded).logits
+            # Softmax the entailment logit across the candidate tags, exactly
+            # as the pipeline does for multi_label=False.
+            entailment = logits[:, ENTAILMENT_INDEX].view(len(chunk), num_tags)
+            scores = torch.softmax(entailment, dim=1)
+            winners = scores.argmax(dim=1)
+            for i, text in enumerate(chunk):
+                yield text, {
+                    "winner_tag": candidate_tags[winners[i]],
+                    "winner_score": scores[i, winners[i]].item()
+                }
+
+@lru_cache(maxsize=100_000)
+def _cached_classify(text: str, tags: tuple) -> Dict[str, Any]:
+    """Classifies a single text, memoizing results for repeated inputs.
+
+    Directory listings repeat the same boilerplate descriptions a lot, so the
+    cache avoids recomputing a full model forward pass for duplicates. The
+    maxsize bound keeps memory growth in check on very large files.
+    """
+    _, result = next(classify_texts([text], list(tags)))
+    return result
 
 def run_classification(text: str, candidate_tags: List[str]) -> Dict[str, Any]:
     """Runs the zero-shot classification and returns processed results."""
-    text = text.strip()
+    text = text.strip()[:CHAR_CAP]
     if not text:
         return {"winner_tag": NONE_TAG, "winner_score": 1.0}
+    if len(text.split()) < MIN_WORDS:
+        return {"winner_tag": NONE_TAG, "winner_score": 0.0}
 
-    classifier = get_classifier()
     full_tag_list = candidate_tags + [NONE_TAG]
-    result = classifier(text, full_tag_list, multi_label=False)
-    
-    return {
-        "winner_tag": result["labels"][0],
-        "winner_score": result["scores"][0]
-    }
+    return _cached_classify(text, tuple(full_tag_list))
 
 @app.command(name="process", help="Classify raw text from a CSV file using an AI model.")
 def process_csv(
@@ -74,45 +257,149 @@ def process_csv(
     output_file: str = typer.Argument(..., help="Path to save the processed CSV file."),
     column: str = typer.Argument(..., help="The name of the column containing the text to classify."),
     tags: str = typer.Option(..., "--tags", help="A comma-separated list of candidate tags."),
+    batch_size: int = typer.Option(0, "--batch-size", help="Number of rows to classify per model batch (0 = pick automatically)."),
+    device: str = typer.Option("auto", "--device", help="Device to run the model on: auto, cpu, or cuda."),
+    precision: str = typer.Option("fp32", "--precision", help="Inference precision: fp32, fp16 (GPU), or bf16 (modern CPU/GPU)."),
+    int8: bool = typer.Option(False, "--int8", help="Dynamically quantize linear layers to int8 for faster CPU inference."),
+    backend: str = typer.Option("torch", "--backend", help="Inference backend: torch or onnx (requires optimum[onnxruntime])."),
+    compile_model: bool = typer.Option(False, "--compile", help="Compile the forward path with torch.compile (PyTorch 2.0+)."),
 ):
     """Processes a CSV file to classify text in a specified COLUMN using TAGS."""
     console.print(f"[bold]Starting batch processing for [cyan]{input_file}[/cyan]...[/bold]")
+    if precision not in PRECISION_DTYPES:
+        console.print(f"[bold red]Error:[/bold red] Unknown precision '{precision}'. Choose from: {', '.join(PRECISION_DTYPES)}.")
+        raise typer.Exit()
+    if backend not in BACKENDS:
+        console.print(f"[bold red]Error:[/bold red] Unknown backend '{backend}'. Choose from: {', '.join(BACKENDS)}.")
+        raise typer.Exit()
+    if device not in ("auto", "cpu", "cuda"):
+        console.print(f"[bold red]Error:[/bold red] Unknown device '{device}'. Choose from: auto, cpu, cuda.")
+        raise typer.Exit()
     candidate_tags = [tag.strip() for tag in tags.split(',')]
-    
+    full_tag_list = candidate_tags + [NONE_TAG]
+
     try:
+        # A raw byte scan gives the progress bar its total without
+        # materializing the file: memory stays flat however large the CSV is.
+        with open(input_file, 'rb') as infile:
+            total_rows = max(0, sum(1 for _ in infile) - 1)
+
         with open(input_file, 'r', encoding='utf-8-sig') as infile:
-            reader = csv.DictReader(infile)
-            original_headers = reader.fieldnames
-            if column not in original_headers:
+            # csv.reader with a precomputed column index avoids allocating a
+            # {header: value} dict for every row, unlike DictReader.
+            reader = csv.reader(infile)
+            original_headers = next(reader, None)
+            if not original_headers or column not in original_headers:
                 console.print(f"[bold red]Error:[/bold red] Column '{column}' not found in the CSV header.")
                 raise typer.Exit()
-            
+            column_index = original_headers.index(column)
+
             new_headers = original_headers + ["Predicted_Tag", "Confidence_Score"]
-            
-            # Read all rows into memory to count for progress bar
-            rows = list(reader)
-            total_rows = len(rows)
+
+            # Load up front so the spinner runs before the progress bar.
+            _, _, resolved_device = get_model(precision, int8, backend, compile_model, device)
+
+            if batch_size <= 0:
+                if resolved_device == "cuda":
+                    # BART-large needs roughly 300 MB of activations per
+                    # sample at typical sequence lengths; size the batch to
+                    # the memory actually free on the GPU.
+                    batch_size = max(1, int(torch.cuda.mem_get_info()[0] / 300_000_000))
+                else:
+                    batch_size = 32
+
+            # Distinct texts classified so far; doubles as the duplicate
+            # cache across chunks.
+            results_by_text = {}
+
+            # Rows resident in memory at any one time.
+            chunk_rows = batch_size * 32
 
             with open(output_file, 'w', newline='', encoding='utf-8') as outfile:
-                writer = csv.DictWriter(outfile, fieldnames=new_headers)
-                writer.writeheader()
-
-                with Progress() as progress:
-                    task = progress.add_task("[green]Processing rows...", total=total_rows)
-                    for row in rows:
-                        text_to_classify = row[column]
-                        try:
-                            result_data = run_classification(text_to_classify, candidate_tags)
-                            row["Predicted_Tag"] = result_data['winner_tag']
-                            row["Confidence_Score"] = result_data['winner_score']
-                        except Exception as e:
-                            console.print(f"[bold red]Error processing row:[/bold red] {e}")
-                            row["Predicted_Tag"] = "ERROR"
-                            row["Confidence_Score"] = "0.0"
-                        finally:
-                            writer.writerow(row)
-                            progress.update(task, advance=1)
-            
+                writer = csv.writer(outfile)
+                writer.writerow(new_headers)
+
+                # A writer thread drains completed rows from a bounded queue
+                # so disk writes overlap with the next batch's forward pass
+                # instead of stalling the model between batches.
+                row_queue = queue.Queue(maxsize=4 * batch_size)
+
+                def drain_rows():
+                    for out_row in iter(row_queue.get, None):
+                        writer.writerow(out_row)
+
+                writer_thread = threading.Thread(target=drain_rows, daemon=True)
+                writer_thread.start()
+
+                try:
+                    with Progress() as progress:
+                        task = progress.add_task("[green]Processing rows...", total=total_rows)
+
+                        def flush_chunk(chunk):
+                            # The model can't classify empty strings, so
+                            # substitute a single space; trivially short texts
+                            # never reach the model at all. Ragged rows missing
+                            # the text column are treated as empty.
+                            texts = [(row[column_index] if column_index < len(row) else "")
+                                     .strip()[:CHAR_CAP] or " " for row in chunk]
+                            for text in texts:
+                                if text not in results_by_text and len(text.split()) < MIN_WORDS:
+                                    # Empty descriptions (substituted with " ")
+                                    # keep run_classification's confident 1.0 so
+                                    # clean doesn't flag them for review; merely
+                                    # short texts stay at 0.0.
+                                    score = 1.0 if text == " " else 0.0
+                                    results_by_text[text] = {"winner_tag": NONE_TAG, "winner_score": score}
+                            pending = list(dict.fromkeys(
+                                text for text in texts if text not in results_by_text))
+                            failed = {}
+                            try:
+                                for text, result in classify_texts(pending, full_tag_list,
+                                                                   batch_size=batch_size, precision=precision,
+                                                                   int8=int8, backend=backend):
+                                    results_by_text[text] = result
+                            except Exception as e:
+                                # A failed batch shouldn't kill the run: retry
+                                # the stragglers one at a time and mark only
+                                # the texts that still fail, as the per-row
+                                # loop used to. Failures stay out of the
+                                # duplicate cache so later occurrences get a
+                                # fresh attempt.
+                                console.print(f"[bold red]Error processing batch:[/bold red] {e}")
+                                for text in pending:
+                                    if text in results_by_text:
+                                        continue
+                                    try:
+                                        _, result = next(classify_texts([text], full_tag_list))
+                                        results_by_text[text] = result
+                                    except Exception as e:
+                                        console.print(f"[bold red]Error processing row:[/bold red] {e}")
+                                        failed[text] = {"winner_tag": "ERROR", "winner_score": "0.0"}
+                            for row, text in zip(chunk, texts):
+                                result = results_by_text.get(text) or failed[text]
+                                row_queue.put(row + [result["winner_tag"], result["winner_score"]])
+                            # Evict oldest entries so the duplicate cache stays
+                            # bounded on files of mostly-distinct texts.
+                            while len(results_by_text) > RESULT_CACHE_MAX:
+                                del results_by_text[next(iter(results_by_text))]
+                            # One coarse update per chunk: per-row updates spend
+                            # a lock acquisition and terminal write on every row.
+                            progress.update(task, advance=len(chunk))
+
+                        chunk = []
+                        for row in reader:
+                            chunk.append(row)
+                            if len(chunk) >= chunk_rows:
+                                flush_chunk(chunk)
+                                chunk = []
+                        if chunk:
+                            flush_chunk(chunk)
+                finally:
+                    # Always sentinel and join the writer so queued rows hit
+                    # disk before the output file closes, even on failure.
+                    row_queue.put(None)
+                    writer_thread.join()
+
             console.print(f"\n[bold green]Success![/bold green] Processed file saved to [cyan]{output_file}[/cyan].")
 
     except FileNotFoundError:
@@ -123,71 +410,76 @@ def process_csv(
 # 2. AUDIT COMMAND (from `analyze_risk_v2.py`)
 # ==============================================================================
 
+def _load_processed_csv(input_path: str) -> pd.DataFrame:
+    """Reads a processed CSV, guaranteeing the columns audit/clean rely on.
+
+    pandas' C parser reads the file in one go, far faster than the pure
+    Python csv.DictReader. Everything stays a string, as with csv.
+    """
+    df = pd.read_csv(input_path, encoding='utf-8-sig', dtype=str, keep_default_na=False)
+    for col in ('Category', 'Predicted_Tag', 'Confidence_Score'):
+        if col not in df.columns:
+            df[col] = ''
+    return df
+
+def _render_audit_report(df: pd.DataFrame, input_path: str):
+    """Computes and prints the risk-analysis tables for a processed DataFrame."""
+    # The whole audit is a handful of column-wise vector ops instead of
+    # per-row Python string/float work.
+    total = len(df)
+    confidence = pd.to_numeric(df['Confidence_Score'], errors='coerce').fillna(0.0).to_numpy()
+    original = df['Category'].str.strip()
+    predicted_long = df['Predicted_Tag'].str.strip()
+    predicted_short = predicted_long.map(TAG_MAP).fillna(predicted_long)
+    match = (original == predicted_short).to_numpy()
+    high_conf = confidence > 0.8
+
+    agreements = int(match.sum())
+    high_conf_agreements = int((match & high_conf).sum())
+    high_conf_disagreements = int((~match & high_conf).sum())
+    low_conf = int((confidence < 0.5).sum())
+
+    danger_rows = pd.DataFrame({
+        "Name": df['Name'] if 'Name' in df.columns else '',
+        "Original": original,
+        "Predicted": predicted_long,
+        "Conf": confidence
+    })[~match & high_conf].to_dict('records')
+
+    console.print(f"\n[bold blue]🛡️  Compliance Audit Report: {input_path}[/bold blue]\n")
+    table = Table(title="Risk Analysis Summary")
+    table.add_column("Metric", style="cyan")
+    table.add_column("Count", justify="right")
+    table.add_column("Percentage", justify="right", style="green")
+
+    table.add_row("Total Rows", str(total), "100%")
+    table.add_row("Total Agreement", str(agreements), f"{(agreements/total)*100:.1f}%")
+    table.add_row("High Confidence Agreement", str(high_conf_agreements), f"{(high_conf_agreements/total)*100:.1f}%")
+    table.add_row("Low Confidence (< 50%)", str(low_conf), f"{(low_conf/total)*100:.1f}%")
+    table.add_row("[red]Danger Zone (High Conf Mismatch)[/red]", str(high_conf_disagreements), f"[red]{(high_conf_disagreements/total)*100:.1f}%[/red]")
+    console.print(table)
+
+    if danger_rows:
+        console.print("\n[bold red]🚨 DANGER ZONE EXAMPLES (High Confidence Mismatches)[/bold red]")
+        danger_table = Table(show_header=True, header_style="bold red")
+        danger_table.add_column("Name")
+        danger_table.add_column("Original")
+        danger_table.add_column("AI Prediction")
+        danger_table.add_column("Conf")
+        for r in danger_rows[:10]:
+            danger_table.add_row(r['Name'][:30], r['Original'], r['Predicted'].replace(" and ", "\n& "), f"{r['Conf']:.2f}")
+        console.print(danger_table)
+        if len(danger_rows) > 10:
+            console.print(f"...and {len(danger_rows) - 10} more rows.")
+
 @app.command(name="audit", help="Analyze a processed CSV to calculate agreement rates and find high-risk mismatches.")
 def audit(
     input_path: str = typer.Argument(..., help="Path to the processed CSV file (e.g., the output of the 'process' command).")
 ):
     """Analyzes a classification audit file to calculate agreement rates and identify risks."""
-    total, agreements, high_conf_agreements, high_conf_disagreements, low_conf = 0, 0, 0, 0, 0
-    danger_rows = []
-
     try:
-        with open(input_path, 'r', encoding='utf-8-sig') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                total += 1
-                original = row.get('Category', '').strip()
-                predicted_long = row.get('Predicted_Tag', '').strip()
-                try:
-                    confidence = float(row.get('Confidence_Score', 0.0))
-                except (ValueError, TypeError):
-                    confidence = 0.0
-                
-                predicted_short = TAG_MAP.get(predicted_long, predicted_long)
-                is_match = (original == predicted_short)
-                
-                if is_match:
-                    agreements += 1
-                    if confidence > 0.8:
-                        high_conf_agreements += 1
-                else:
-                    if confidence > 0.8:
-                        high_conf_disagreements += 1
-                        danger_rows.append({
-                            "Name": row.get('Name'),
-                            "Original": original,
-                            "Predicted": predicted_long,
-                            "Conf": confidence
-                        })
-                if confidence < 0.5:
-                    low_conf += 1
-        
-        console.print(f"\n[bold blue]🛡️  Compliance Audit Report: {input_path}[/bold blue]\n")
-        table = Table(title="Risk Analysis Summary")
-        table.add_column("Metric", style="cyan")
-        table.add_column("Count", justify="right")
-        table.add_column("Percentage", justify="right", style="green")
-
-        table.add_row("Total Rows", str(total), "100%")
-        table.add_row("Total Agreement", str(agreements), f"{(agreements/total)*100:.1f}%")
-        table.add_row("High Confidence Agreement", str(high_conf_agreements), f"{(high_conf_agreements/total)*100:.1f}%")
-        table.add_row("Low Confidence (< 50%)", str(low_conf), f"{(low_conf/total)*100:.1f}%")
-        table.add_row("[red]Danger Zone (High Conf Mismatch)[/red]", str(high_conf_disagreements), f"[red]{(high_conf_disagreements/total)*100:.1f}%[/red]")
-        console.print(table)
-
-        if danger_rows:
-            console.print("\n[bold red]🚨 DANGER ZONE EXAMPLES (High Confidence Mismatches)[/bold red]")
-            danger_table = Table(show_header=True, header_style="bold red")
-            danger_table.add_column("Name")
-            danger_table.add_column("Original")
-            danger_table.add_column("AI Prediction")
-            danger_table.add_column("Conf")
-            for r in danger_rows[:10]:
-                danger_table.add_row(r['Name'][:30], r['Original'], r['Predicted'].replace(" and ", "\n& "), f"{r['Conf']:.2f}")
-            console.print(danger_table)
-            if len(danger_rows) > 10:
-                console.print(f"...and {len(danger_rows) - 10} more rows.")
-
+        df = _load_processed_csv(input_path)
+        _render_audit_report(df, input_path)
     except FileNotFoundError:
         console.print(f"[bold red]Error:[/bold red] Input file '{input_path}' not found.")
         raise typer.Exit()
@@ -197,66 +489,83 @@ def audit(
 # 3. CLEAN COMMAND (from `apply_fixes_v2.py`)
 # ==============================================================================
 
+def _apply_clean_policy(df: pd.DataFrame) -> Dict[str, int]:
+    """Adds Audit_Status/Final_Tag columns in place and returns summary stats.
+
+    The policy is a pure function of two columns, so the whole if/elif
+    ladder collapses to boolean masks and a single np.select.
+    """
+    confidence = pd.to_numeric(df['Confidence_Score'], errors='coerce').fillna(0.0).to_numpy()
+    original = df['Category'].str.strip()
+    predicted_long = df['Predicted_Tag'].str.strip()
+    mapped = predicted_long.map(COMBINED_TAG_MAP)
+    predicted_short = mapped.str[0].fillna(predicted_long)
+    final_map = mapped.str[1]
+
+    auto_fix = ((confidence > 0.85)
+                & (original != predicted_short).to_numpy()
+                & final_map.notna().to_numpy()
+                & (final_map != "None").to_numpy())
+    needs_review = confidence < 0.5
+
+    df['Audit_Status'] = np.select([auto_fix, needs_review],
+                                   ["AUTO_FIXED", "NEEDS_REVIEW"], default="VERIFIED")
+    df['Final_Tag'] = np.where(auto_fix, final_map, original)
+
+    status_counts = df['Audit_Status'].value_counts()
+    return {
+        "total": len(df),
+        "auto_fixed": int(status_counts.get("AUTO_FIXED", 0)),
+        "low_conf": int(status_counts.get("NEEDS_REVIEW", 0)),
+        "verified": int(status_counts.get("VERIFIED", 0)),
+    }
+
+def _render_clean_summary(stats: Dict[str, int], output_path: str):
+    """Prints the summary table for a cleanup run."""
+    console.print(f"\n[bold green]✅ Audit Complete. Fixes applied to: {output_path}[/bold green]")
+    summary_table = Table(title="File Processing Summary")
+    summary_table.add_column("Metric", style="cyan")
+    summary_table.add_column("Count", justify="right")
+    summary_table.add_column("Percentage", justify="right", style="green")
+
+    summary_table.add_row("Total Rows", str(stats['total']), "100%")
+    summary_table.add_row("Verified (Kept Original)", str(stats['verified']), f"{(stats['verified']/stats['total'])*100:.1f}%")
+    summary_table.add_row("Low Confidence (Needs Review)", str(stats['low_conf']), f"{(stats['low_conf']/stats['total'])*100:.1f}%")
+    summary_table.add_row("Auto-Fixed (High Risk Errors)", f"[bold red]{stats['auto_fixed']}[/bold red]", f"[bold red]{(stats['auto_fixed']/stats['total'])*100:.1f}%")
+    console.print(summary_table)
+
 @app.command(name="clean", help="Apply a compliance policy to an audited CSV to generate a final, clean dataset.")
 def clean(
     input_path: str = typer.Argument(..., help="Path to the audited CSV file."),
     output_path: str = typer.Argument(..., help="Path to save the final clean CSV file.")
 ):
     """Applies a compliance policy to an audited CSV to generate a final, clean dataset."""
-    stats = {"auto_fixed": 0, "verified": 0, "low_conf": 0, "total": 0}
-    
     try:
-        with open(input_path, 'r', encoding='utf-8-sig') as fin, \
-             open(output_path, 'w', encoding='utf-8', newline='') as fout:
-            
-            reader = csv.DictReader(fin)
-            fieldnames = reader.fieldnames + ['Audit_Status', 'Final_Tag']
-            writer = csv.DictWriter(fout, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for row in reader:
-                stats["total"] += 1
-                original = row.get('Category', '').strip()
-                predicted_long = row.get('Predicted_Tag', '').strip()
-                try:
-                    confidence = float(row.get('Confidence_Score', 0.0))
-                except (ValueError, TypeError):
-                    confidence = 0.0
-                
-                predicted_short_for_comparison = TAG_MAP.get(predicted_long, predicted_long)
-                
-                if confidence > 0.85 and original != predicted_short_for_comparison:
-                    final_tag = SHORT_TAG_MAP.get(predicted_long)
-                    if final_tag and final_tag != "None":
-                        row['Final_Tag'] = final_tag
-                        row['Audit_Status'] = "AUTO_FIXED"
-                        stats["auto_fixed"] += 1
-                    else:
-                        row['Final_Tag'] = original
-                        row['Audit_Status'] = "VERIFIED"
-                        stats["verified"] += 1
-                elif confidence < 0.5:
-                    row['Final_Tag'] = original
-                    row['Audit_Status'] = "NEEDS_REVIEW"
-                    stats["low_conf"] += 1
-                else:
-                    row['Final_Tag'] = original
-                    row['Audit_Status'] = "VERIFIED"
-                    stats["verified"] += 1
-                writer.writerow(row)
-
-        console.print(f"\n[bold green]✅ Audit Complete. Fixes applied to: {output_path}[/bold green]")
-        summary_table = Table(title="File Processing Summary")
-        summary_table.add_column("Metric", style="cyan")
-        summary_table.add_column("Count", justify="right")
-        summary_table.add_column("Percentage", justify="right", style="green")
-
-        summary_table.add_row("Total Rows", str(stats['total']), "100%")
-        summary_table.add_row("Verified (Kept Original)", str(stats['verified']), f"{(stats['verified']/stats['total'])*100:.1f}%")
-        summary_table.add_row("Low Confidence (Needs Review)", str(stats['low_conf']), f"{(stats['low_conf']/stats['total'])*100:.1f}%")
-        summary_table.add_row("Auto-Fixed (High Risk Errors)", f"[bold red]{stats['auto_fixed']}[/bold red]", f"[bold red]{(stats['auto_fixed']/stats['total'])*100:.1f}%")
-        console.print(summary_table)
+        df = _load_processed_csv(input_path)
+        stats = _apply_clean_policy(df)
+        df.to_csv(output_path, index=False)
+        _render_clean_summary(stats, output_path)
+    except FileNotFoundError:
+        console.print(f"[bold red]Error:[/bold red] Input file '{input_path}' not found.")
+        raise typer.Exit()
+
+
+# ==============================================================================
+# 4. AUDIT-CLEAN COMMAND (fused single-pass audit + clean)
+# ==============================================================================
 
+@app.command(name="audit-clean", help="Audit and clean a processed CSV in a single pass over the file.")
+def audit_clean(
+    input_path: str = typer.Argument(..., help="Path to the processed CSV file."),
+    output_path: str = typer.Argument(..., help="Path to save the final clean CSV file.")
+):
+    """Runs the audit report and the cleanup policy over a single CSV read."""
+    try:
+        df = _load_processed_csv(input_path)
+        _render_audit_report(df, input_path)
+        stats = _apply_clean_policy(df)
+        df.to_csv(output_path, index=False)
+        _render_clean_summary(stats, output_path)
     except FileNotFoundError:
         console.print(f"[bold red]Error:[/bold red] Input file '{input_path}' not found.")
         raise typer.Exit()